@@ -5,20 +5,128 @@ No job matching, no complex logic - just resume data.
 """
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
-import json
+from fastapi.middleware.gzip import GZipMiddleware
+import orjson
 from pathlib import Path
 
 # Load resume once at startup
 RESUME_FILE = Path(__file__).parent / "resume.json"
 
+def _encode(payload):
+    """Encode a payload as compact UTF-8 JSON bytes."""
+    return orjson.dumps(payload)
+
+def _json_response(content, status_code=200):
+    """Return already-encoded JSON bytes without another render pass."""
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+def _pretty(request, response):
+    """Re-indent a JSON response when the client opts in with ?pretty=1 (debugging)."""
+    if request.query_params.get("pretty") != "1":
+        return response
+    return _json_response(
+        orjson.dumps(orjson.loads(response.body), option=orjson.OPT_INDENT_2),
+        status_code=response.status_code,
+    )
+
+# Parsed resume, pre-encoded /resume body and encoded tool results,
+# all keyed on the file's mtime
+_resume_cache = {"mtime": None, "data": None, "json_bytes": None, "tool_results": {}}
+
 def load_resume():
-    """Load resume data from JSON."""
-    if not RESUME_FILE.exists():
+    """Load resume data from JSON, re-reading only when the file changes."""
+    try:
+        mtime = RESUME_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        _resume_cache.update(mtime=None, data=None, json_bytes=None, tool_results={})
         return None
-    with open(RESUME_FILE, 'r') as f:
-        return json.load(f)
+
+    if mtime != _resume_cache["mtime"]:
+        data = orjson.loads(RESUME_FILE.read_bytes())
+        _resume_cache.update(
+            mtime=mtime,
+            data=data,
+            json_bytes=_encode(data),
+            tool_results={},
+        )
+    return _resume_cache["data"]
+
+# Warm the cache so the first request doesn't pay for the parse. A malformed
+# file must not stop the server from starting; the cache stays cold and the
+# next request retries.
+try:
+    load_resume()
+except orjson.JSONDecodeError:
+    pass
+
+# JSON-RPC requests here are tiny; refuse anything bigger before parsing it
+MAX_BODY_BYTES = 64 * 1024
+
+# Static MCP metadata - built once, never changes per request
+SERVER_INFO = {"name": "simple-resume-mcp", "version": "1.0.0"}
+PROTOCOL_VERSION = "2024-11-05"
+
+INITIALIZE_RESULT = {
+    "protocolVersion": PROTOCOL_VERSION,
+    "capabilities": {"tools": {"listChanged": True}},
+    "serverInfo": SERVER_INFO
+}
+
+TOOLS = [
+    {
+        "name": "get_resume_info",
+        "description": "Get Anix Lynch's complete resume including skills, projects, experience, and contact info",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "get_skills",
+        "description": "Get Anix's technical skills with proficiency ratings",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "min_weight": {
+                    "type": "integer",
+                    "description": "Minimum skill weight (1-10)",
+                    "default": 0
+                }
+            }
+        }
+    },
+    {
+        "name": "get_projects",
+        "description": "Get Anix's portfolio projects",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "get_experience",
+        "description": "Get Anix's work experience",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    }
+]
+
+# Pre-encoded JSON-RPC results; only the request id varies per call
+_INITIALIZE_RESULT_BYTES = _encode(INITIALIZE_RESULT)
+_TOOLS_LIST_RESULT_BYTES = _encode({"tools": TOOLS})
+
+# Pre-encoded bodies for the static GET endpoints
+_ROOT_BODY = _encode({"status": "ok", "message": "Simple Resume MCP Server"})
+_MCP_INFO_BODY = _encode({
+    "protocol": "mcp",
+    "version": PROTOCOL_VERSION,
+    "capabilities": {"tools": True},
+    "serverInfo": SERVER_INFO
+})
 
 # Create FastAPI app
 app = FastAPI(title="Simple Resume MCP", version="1.0.0")
@@ -32,165 +140,182 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger bodies (full resume, tool results) over the ngrok link
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Health check."""
-    return {"status": "ok", "message": "Simple Resume MCP Server"}
+    return _pretty(request, _json_response(_ROOT_BODY))
+
+def _rpc_result(rid, result_bytes):
+    """Splice pre-encoded result bytes into a JSON-RPC envelope for `rid`."""
+    return _json_response(b'{"jsonrpc":"2.0","id":' + _encode(rid) + b',"result":' + result_bytes + b'}')
+
+def _rpc_error(rid, code, message, status_code=200):
+    """JSON-RPC error response."""
+    return _json_response(_encode({
+        "jsonrpc": "2.0",
+        "id": rid,
+        "error": {
+            "code": code,
+            "message": message
+        }
+    }), status_code=status_code)
+
+def _handle_initialize(body):
+    """JSON-RPC initialize."""
+    return _rpc_result(body.get("id"), _INITIALIZE_RESULT_BYTES)
+
+def _handle_tools_list(body):
+    """JSON-RPC tools/list."""
+    return _rpc_result(body.get("id"), _TOOLS_LIST_RESULT_BYTES)
+
+def _tool_result(result):
+    """Encode a tool's output as an MCP text-content result.
+
+    The output is encoded once, then escaped once as the "text" string;
+    the fixed envelope around it is spliced in as bytes.
+    """
+    text = _encode(_encode(result).decode("utf-8"))
+    return b'{"content":[{"type":"text","text":' + text + b'}]}'
+
+def _tool_get_resume_info(resume, args):
+    """Full resume."""
+    return resume
+
+def _tool_get_skills(resume, args):
+    """Skills at or above min_weight."""
+    min_weight = args.get("min_weight", 0)
+    skills = {k: v for k, v in resume.get("skills", {}).items() if v >= min_weight}
+    return {"skills": skills}
+
+def _tool_get_projects(resume, args):
+    """Portfolio projects."""
+    return {"projects": resume.get("projects", [])}
+
+def _tool_get_experience(resume, args):
+    """Work experience."""
+    return {"experience": resume.get("experience", [])}
+
+# Cap on cached tool results per resume load (get_skills keys on min_weight)
+MAX_CACHED_TOOL_RESULTS = 32
+
+# Tool name -> (handler(resume, args), cache_key(args)). The key names every
+# argument that changes the output; results live in _resume_cache["tool_results"]
+TOOL_HANDLERS = {
+    "get_resume_info": (_tool_get_resume_info, lambda args: "get_resume_info"),
+    "get_skills": (_tool_get_skills, lambda args: ("get_skills", args.get("min_weight", 0))),
+    "get_projects": (_tool_get_projects, lambda args: "get_projects"),
+    "get_experience": (_tool_get_experience, lambda args: "get_experience"),
+}
+
+def _handle_tools_call(body):
+    """JSON-RPC tools/call."""
+    params = body.get("params", {})
+    tool_name = params.get("name")
+    args = params.get("arguments", {})
+    
+    resume = load_resume()
+    if not resume:
+        return _rpc_error(body.get("id"), -32000, "Resume file not found")
+    
+    entry = TOOL_HANDLERS.get(tool_name) if isinstance(tool_name, str) else None
+    if entry is None:
+        return _rpc_error(body.get("id"), -32601, f"Unknown tool: {tool_name}")
+    
+    tool, cache_key = entry
+    key = cache_key(args)
+    cached = _resume_cache["tool_results"]
+    result_bytes = cached.get(key)
+    if result_bytes is None:
+        result_bytes = _tool_result(tool(resume, args))
+        if len(cached) >= MAX_CACHED_TOOL_RESULTS:
+            cached.pop(next(iter(cached)))  # drop the oldest entry
+        cached[key] = result_bytes
+    return _rpc_result(body.get("id"), result_bytes)
+
+# JSON-RPC method -> handler
+METHOD_HANDLERS = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+}
+
+async def _read_body(request):
+    """Read the request body, or None once it exceeds MAX_BODY_BYTES."""
+    declared = request.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > MAX_BODY_BYTES:
+        return None
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+def _valid_id(rid):
+    """Whether `rid` can be echoed back exactly.
+
+    orjson keeps integers exact only within int64/uint64; larger ones come
+    back as integral floats (99999999999999999999 -> 1e+20), so those are
+    the one case rejected.
+    """
+    return not (isinstance(rid, float) and rid.is_integer() and abs(rid) >= 2**63)
 
-@app.get("/mcp")
-@app.post("/mcp")
 async def mcp_endpoint(request: Request):
     """MCP endpoint for ChatGPT."""
+    return _pretty(request, await _mcp_dispatch(request))
+
+async def _mcp_dispatch(request):
+    """Answer a GET info probe or one JSON-RPC call."""
+    # Starlette adds HEAD to GET routes; keep the baseline 405 for it
+    if request.method == "HEAD":
+        response = _json_response(_encode({"detail": "Method Not Allowed"}), status_code=405)
+        response.headers["allow"] = "GET, POST"
+        return response
     
     if request.method == "GET":
         # Health check
-        return JSONResponse({
-            "protocol": "mcp",
-            "version": "2024-11-05",
-            "capabilities": {"tools": True},
-            "serverInfo": {"name": "simple-resume-mcp", "version": "1.0.0"}
-        })
+        return _json_response(_MCP_INFO_BODY)
     
-    # POST - handle JSON-RPC
-    body = await request.json()
+    # POST - handle JSON-RPC (orjson parses the raw bytes, no str decode)
+    raw = await _read_body(request)
+    if raw is None:
+        return _rpc_error(None, -32600, "Request too large", status_code=413)
     
-    # Initialize
-    if body.get("method") == "initialize":
-        return JSONResponse({
-            "jsonrpc": "2.0",
-            "id": body.get("id"),
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {"tools": {"listChanged": True}},
-                "serverInfo": {"name": "simple-resume-mcp", "version": "1.0.0"}
-            }
-        })
+    try:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return _rpc_error(None, -32700, "Parse error")
     
-    # List tools
-    elif body.get("method") == "tools/list":
-        return JSONResponse({
-            "jsonrpc": "2.0",
-            "id": body.get("id"),
-            "result": {
-                "tools": [
-                    {
-                        "name": "get_resume_info",
-                        "description": "Get Anix Lynch's complete resume including skills, projects, experience, and contact info",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    },
-                    {
-                        "name": "get_skills",
-                        "description": "Get Anix's technical skills with proficiency ratings",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "min_weight": {
-                                    "type": "integer",
-                                    "description": "Minimum skill weight (1-10)",
-                                    "default": 0
-                                }
-                            }
-                        }
-                    },
-                    {
-                        "name": "get_projects",
-                        "description": "Get Anix's portfolio projects",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    },
-                    {
-                        "name": "get_experience",
-                        "description": "Get Anix's work experience",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {}
-                        }
-                    }
-                ]
-            }
-        })
+    if not isinstance(body, dict) or not _valid_id(body.get("id")):
+        return _rpc_error(None, -32600, "Invalid Request")
     
-    # Call tool
-    elif body.get("method") == "tools/call":
-        params = body.get("params", {})
-        tool_name = params.get("name")
-        args = params.get("arguments", {})
-        
-        resume = load_resume()
-        if not resume:
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "id": body.get("id"),
-                "error": {
-                    "code": -32000,
-                    "message": "Resume file not found"
-                }
-            })
-        
-        # Handle different tools
-        if tool_name == "get_resume_info":
-            result = resume
-        
-        elif tool_name == "get_skills":
-            min_weight = args.get("min_weight", 0)
-            skills = {k: v for k, v in resume.get("skills", {}).items() if v >= min_weight}
-            result = {"skills": skills}
-        
-        elif tool_name == "get_projects":
-            result = {"projects": resume.get("projects", [])}
-        
-        elif tool_name == "get_experience":
-            result = {"experience": resume.get("experience", [])}
-        
-        else:
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "id": body.get("id"),
-                "error": {
-                    "code": -32601,
-                    "message": f"Unknown tool: {tool_name}"
-                }
-            })
-        
-        return JSONResponse({
-            "jsonrpc": "2.0",
-            "id": body.get("id"),
-            "result": {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": json.dumps(result, indent=2)
-                    }
-                ]
-            }
-        })
+    method = body.get("method")
+    handler = METHOD_HANDLERS.get(method) if isinstance(method, str) else None
+    if handler is not None:
+        return handler(body)
     
     # Unknown method
-    return JSONResponse({
-        "jsonrpc": "2.0",
-        "id": body.get("id"),
-        "error": {
-            "code": -32601,
-            "message": f"Unknown method: {body.get('method')}"
-        }
-    })
+    return _rpc_error(body.get("id"), -32601, f"Unknown method: {body.get('method')}")
+
+# Plain Starlette route: skips FastAPI's per-request dependency/validation layer
+app.add_route("/mcp", mcp_endpoint, methods=["GET", "POST"])
 
 @app.get("/resume")
-async def get_resume_json():
+async def get_resume_json(request: Request):
     """Serve raw resume JSON for Perplexity / Web Browsers."""
     resume = load_resume()
     if not resume:
-        return JSONResponse({"error": "Resume not found"}, status_code=404)
-    return JSONResponse(resume)
+        return _pretty(request, _json_response(_encode({"error": "Resume not found"}), status_code=404))
+    return _pretty(request, _json_response(_resume_cache["json_bytes"]))
 
 if __name__ == "__main__":
     import uvicorn
     print("🚀 Starting Simple Resume MCP Server on http://localhost:8000")
     print("📄 Serving resume.json to ChatGPT")
     print("🌐 Expose via: ngrok http 8000 --domain anix.ngrok.app")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools", access_log=False, log_level="warning")
@@ -21,7 +21,7 @@ fi
 
 # 3. Start FastAPI Server
 echo "Starting FastAPI server..."
-nohup uvicorn server:app --host 0.0.0.0 --port 8000 > server.log 2>&1 &
+nohup uvicorn server:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --no-access-log --log-level warning > server.log 2>&1 &
 SERVER_PID=$!
 echo $SERVER_PID > server.pid
 echo -e "${GREEN}✓ Server running (PID: $SERVER_PID)${NC}"
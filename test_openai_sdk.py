@@ -1,7 +1,8 @@
 import os
-import json
-import requests
-from openai import OpenAI
+import asyncio
+import orjson
+import httpx
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,7 +16,10 @@ if not OPENAI_API_KEY:
     print("⚠️  Please set OPENAI_API_KEY in .env or environment")
     exit(1)
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+# One keep-alive HTTP/2 connection to the MCP server, shared by concurrent tool calls
+mcp_client = httpx.AsyncClient(http2=True, timeout=30)
 
 # 1. Define the tools for OpenAI (Client-side definition)
 # Note: In a real MCP client, you'd fetch these from the server via tools/list
@@ -46,7 +50,7 @@ tools = [
     }
 ]
 
-def call_mcp_tool(tool_name, arguments):
+async def call_mcp_tool(tool_name, arguments):
     """Execute the tool call against the MCP server"""
     payload = {
         "jsonrpc": "2.0",
@@ -59,9 +63,13 @@ def call_mcp_tool(tool_name, arguments):
     }
     
     try:
-        response = requests.post(MCP_SERVER_URL, json=payload)
+        response = await mcp_client.post(
+            MCP_SERVER_URL,
+            content=orjson.dumps(payload),
+            headers={"content-type": "application/json"},
+        )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         if "error" in data:
             return f"Error: {data['error']['message']}"
@@ -74,7 +82,7 @@ def call_mcp_tool(tool_name, arguments):
     except Exception as e:
         return f"Failed to call MCP: {str(e)}"
 
-def main():
+async def main():
     print(f"🤖 Connecting to OpenAI with MCP Tool Calling...")
     print(f"🔌 MCP Server: {MCP_SERVER_URL}")
     
@@ -85,7 +93,7 @@ def main():
     messages = [{"role": "user", "content": user_query}]
     
     # 1. First call to OpenAI to decide which tool to use
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model="gpt-4-turbo-preview",
         messages=messages,
         tools=tools,
@@ -101,15 +109,18 @@ def main():
         # Extend conversation with assistant's reply
         messages.append(response_message)
         
-        # 2. Execute tool calls
+        # 2. Execute tool calls concurrently against our MCP server
+        calls = []
         for tool_call in tool_calls:
             function_name = tool_call.function.name
-            function_args = json.loads(tool_call.function.arguments)
-            
+            function_args = orjson.loads(tool_call.function.arguments)
             print(f"   → Calling {function_name}({function_args})...")
-            
-            # Call our MCP server
-            function_response = call_mcp_tool(function_name, function_args)
+            calls.append(call_mcp_tool(function_name, function_args))
+        
+        function_responses = await asyncio.gather(*calls)
+        
+        for tool_call, function_response in zip(tool_calls, function_responses):
+            function_name = tool_call.function.name
             
             print(f"   ← Got response ({len(function_response)} chars)")
             
@@ -125,7 +136,7 @@ def main():
             
         # 3. Second call to OpenAI to generate final answer
         print("📝 Generating final answer...")
-        final_response = client.chat.completions.create(
+        final_response = await client.chat.completions.create(
             model="gpt-4-turbo-preview",
             messages=messages,
         )
@@ -135,5 +146,11 @@ def main():
     else:
         print("OpenAI didn't want to call any tools.")
 
+async def run():
+    try:
+        await main()
+    finally:
+        await mcp_client.aclose()
+
 if __name__ == "__main__":
-    main()
+    asyncio.run(run())